@@ -1,15 +1,26 @@
 from .agents import Agent
-from .auctions import Auction, AuctionSimulator, AuctionResult
+from .auctions import Auction, AuctionSimulator, AuctionResult, compute_bid_matrix, resolve_bid_matrix, simulate_auction_batch
 from .strategies import BiddingStrategy, get_available_strategies
 from .utils import generate_random_valuations, calculate_theoretical_revenue
+from .tournament import StrategyTournament
+from .combinatorial import CombinatorialAuction, CombinatorialResult, CombinatorialSimulator
+from .campaigns import CampaignSimulator
 
 __all__ = [
     'Agent',
     'Auction', 
     'AuctionSimulator',
     'AuctionResult',
+    'compute_bid_matrix',
+    'resolve_bid_matrix',
+    'simulate_auction_batch',
     'BiddingStrategy',
     'get_available_strategies',
     'generate_random_valuations',
-    'calculate_theoretical_revenue'
+    'calculate_theoretical_revenue',
+    'StrategyTournament',
+    'CombinatorialAuction',
+    'CombinatorialResult',
+    'CombinatorialSimulator',
+    'CampaignSimulator'
 ]
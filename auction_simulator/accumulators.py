@@ -0,0 +1,112 @@
+"""
+Streaming accumulators for per-strategy auction statistics.
+"""
+
+import numpy as np
+from typing import Dict, Sequence
+
+
+class SlotAccumulator:
+
+    def __init__(self, slot_strategies: Sequence[str]):
+        self.slot_strategies = list(slot_strategies)
+        self.strategy_names = list(dict.fromkeys(self.slot_strategies))
+        index = {name: i for i, name in enumerate(self.strategy_names)}
+        self.slot_codes = np.array([index[s] for s in self.slot_strategies], dtype=np.intp)
+
+        num_slots = len(self.slot_strategies)
+        self.rounds = 0
+        self.wins = np.zeros(num_slots, dtype=np.int64)
+        self.bid_sum = np.zeros(num_slots)
+        self.valuation_sum = np.zeros(num_slots)
+        self.payment_sum = np.zeros(num_slots)
+        self.payoff_sum = np.zeros(num_slots)
+        self.payoff_sq_sum = np.zeros(num_slots)
+
+    def update(self, bids: np.ndarray, valuations: np.ndarray,
+               payoffs: np.ndarray, won: np.ndarray, payment: float):
+        won = np.asarray(won, dtype=bool)
+        payoffs = np.asarray(payoffs, dtype=float)
+
+        self.rounds += 1
+        self.wins += won
+        self.bid_sum += bids
+        self.valuation_sum += valuations
+        self.payment_sum += won * payment
+        self.payoff_sum += payoffs
+        self.payoff_sq_sum += payoffs * payoffs
+
+    def update_batch(self, bids: np.ndarray, valuations: np.ndarray,
+                     payoffs: np.ndarray, won: np.ndarray, payments: np.ndarray):
+        # Arrays are (num_rounds, num_slots); payments is one entry per round.
+        won = np.asarray(won, dtype=bool)
+        payoffs = np.asarray(payoffs, dtype=float)
+        payments = np.asarray(payments, dtype=float)
+
+        self.rounds += won.shape[0]
+        self.wins += won.sum(axis=0)
+        self.bid_sum += np.sum(bids, axis=0)
+        self.valuation_sum += np.sum(valuations, axis=0)
+        self.payment_sum += (won * payments[:, None]).sum(axis=0)
+        self.payoff_sum += payoffs.sum(axis=0)
+        self.payoff_sq_sum += (payoffs * payoffs).sum(axis=0)
+
+    def state_arrays(self) -> Dict[str, np.ndarray]:
+        return {
+            "rounds": np.array(self.rounds, dtype=np.int64),
+            "wins": self.wins,
+            "bid_sum": self.bid_sum,
+            "valuation_sum": self.valuation_sum,
+            "payment_sum": self.payment_sum,
+            "payoff_sum": self.payoff_sum,
+            "payoff_sq_sum": self.payoff_sq_sum
+        }
+
+    def load_state_arrays(self, arrays: Dict[str, np.ndarray]):
+        self.rounds = int(arrays["rounds"])
+        for name in ("wins", "bid_sum", "valuation_sum", "payment_sum",
+                     "payoff_sum", "payoff_sq_sum"):
+            current = getattr(self, name)
+            if arrays[name].shape != current.shape:
+                raise ValueError(f"Accumulator state '{name}' does not match {len(current)} slots")
+            setattr(self, name, arrays[name].astype(current.dtype))
+
+    def _by_strategy(self, values: np.ndarray) -> np.ndarray:
+        return np.bincount(self.slot_codes, weights=values,
+                           minlength=len(self.strategy_names))
+
+    def strategy_statistics(self) -> Dict[str, Dict[str, float]]:
+        slots = np.bincount(self.slot_codes, minlength=len(self.strategy_names))
+        participations = slots * self.rounds
+        wins = self._by_strategy(self.wins.astype(float))
+        bid_sum = self._by_strategy(self.bid_sum)
+        valuation_sum = self._by_strategy(self.valuation_sum)
+        payment_sum = self._by_strategy(self.payment_sum)
+        payoff_sum = self._by_strategy(self.payoff_sum)
+        payoff_sq_sum = self._by_strategy(self.payoff_sq_sum)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            win_rate = wins / participations
+            expected_payoff = payoff_sum / participations
+            payoff_var = payoff_sq_sum / participations - expected_payoff ** 2
+            avg_bid = bid_sum / participations
+            avg_valuation = valuation_sum / participations
+            avg_payment = payment_sum / wins
+            avg_winning_payoff = payoff_sum / wins
+
+        stats = {}
+        for i, strategy in enumerate(self.strategy_names):
+            stats[strategy] = {
+                'participations': int(participations[i]),
+                'total_wins': int(wins[i]),
+                'win_rate': float(np.nan_to_num(win_rate[i])),
+                'expected_payoff': float(np.nan_to_num(expected_payoff[i])),
+                'payoff_std': float(np.sqrt(max(np.nan_to_num(payoff_var[i]), 0.0))),
+                'payoff_std_error': float(np.sqrt(max(np.nan_to_num(payoff_var[i]), 0.0)
+                                                  / max(participations[i], 1))),
+                'avg_bid': float(np.nan_to_num(avg_bid[i])),
+                'avg_valuation': float(np.nan_to_num(avg_valuation[i])),
+                'avg_payment': float(np.nan_to_num(avg_payment[i])),
+                'avg_winning_payoff': float(np.nan_to_num(avg_winning_payoff[i]))
+            }
+        return stats
@@ -4,10 +4,12 @@ from typing import Dict, Any
 
 class Agent:
     
-    def __init__(self, agent_id: int, valuation: float, strategy: str = "truthful"):
+    def __init__(self, agent_id: int, valuation: float, strategy: str = "truthful",
+                 rng: np.random.Generator = None):
         self.agent_id = agent_id
         self.valuation = valuation
         self.strategy = strategy
+        self.rng = rng
         self.bid = 0.0
         self.payoff = 0.0
         self.won = False
@@ -15,7 +17,7 @@ class Agent:
     def place_bid(self, auction_type: str, num_bidders: int, **kwargs) -> float:
         from .strategies import BiddingStrategy
         
-        strategy_obj = BiddingStrategy(self.strategy)
+        strategy_obj = BiddingStrategy(self.strategy, rng=self.rng)
         self.bid = strategy_obj.calculate_bid(
             valuation=self.valuation,
             auction_type=auction_type,
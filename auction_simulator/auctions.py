@@ -1,6 +1,20 @@
+import json
+import os
 import numpy as np
 from typing import List, Tuple, Dict, Any
 from .agents import Agent
+from .accumulators import SlotAccumulator
+from .checkpoint import (save_checkpoint, load_checkpoint, append_records, load_records,
+                         get_rng_state, set_rng_state)
+from .strategies import BiddingStrategy
+from .utils import generate_valuation_matrix
+
+# Rounds whose valuations and bids are drawn together. Fixed so that seeded
+# results never depend on how often a run checkpoints.
+DRAW_CHUNK_SIZE = 1000
+
+# Leading fields of a per-round record in run_simulation; bids follow.
+_RECORD_BIDS = 4
 
 
 class AuctionResult:
@@ -24,17 +38,23 @@ class Auction:
     def add_agents(self, agents: List[Agent]):
         self.agents = agents
     
-    def run_auction(self) -> AuctionResult:
+    def run_auction(self, bids: List[float] = None) -> AuctionResult:
         if not self.agents:
             raise ValueError("No agents in auction")
         
         for agent in self.agents:
             agent.reset()
         
-        bids = []
-        for agent in self.agents:
-            bid = agent.place_bid(self.auction_type, len(self.agents))
-            bids.append(bid)
+        if bids is None:
+            bids = []
+            for agent in self.agents:
+                bid = agent.place_bid(self.auction_type, len(self.agents))
+                bids.append(bid)
+        else:
+            # Bids precomputed in bulk, e.g. by compute_bid_matrix.
+            bids = list(bids)
+            for agent, bid in zip(self.agents, bids):
+                agent.bid = bid
         
         winner, payment = self._determine_winner_and_payment(bids)
         
@@ -88,74 +108,220 @@ class Auction:
         return 1.0 if winner == highest_valuation_agent else 0.0
 
 
+def compute_bid_matrix(auction_type: str, slot_strategies: List[str], valuations: np.ndarray,
+                       rng: np.random.Generator = None) -> np.ndarray:
+    valuations = np.asarray(valuations, dtype=float)
+    num_bidders = valuations.shape[1]
+    
+    bids = np.empty_like(valuations)
+    # Iterate in first-appearance order so the draw sequence is deterministic.
+    for strategy in dict.fromkeys(slot_strategies):
+        columns = [i for i, s in enumerate(slot_strategies) if s == strategy]
+        bids[:, columns] = BiddingStrategy(strategy, rng=rng).calculate_bids(
+            valuations[:, columns], auction_type, num_bidders
+        )
+    return bids
+
+
+def resolve_bid_matrix(auction_type: str, valuations: np.ndarray,
+                       bids: np.ndarray) -> Dict[str, np.ndarray]:
+    # Vectorized equivalent of Auction.run_auction for (num_rounds, num_bidders)
+    # valuation and bid matrices; one column per bidder slot.
+    valuations = np.asarray(valuations, dtype=float)
+    bids = np.asarray(bids, dtype=float)
+    num_rounds, num_bidders = valuations.shape
+    
+    rows = np.arange(num_rounds)
+    winners = np.argmax(bids, axis=1)
+    if auction_type == "first_price":
+        payments = bids[rows, winners]
+    elif auction_type == "second_price":
+        if num_bidders > 1:
+            payments = np.partition(bids, num_bidders - 2, axis=1)[:, num_bidders - 2]
+        else:
+            payments = np.zeros(num_rounds)
+    else:
+        raise ValueError(f"Unknown auction type: {auction_type}")
+    
+    won = np.zeros_like(bids, dtype=bool)
+    won[rows, winners] = True
+    payoffs = np.where(won, valuations - payments[:, None], 0.0)
+    efficiencies = (valuations[rows, winners] == valuations.max(axis=1)).astype(float)
+    
+    return {
+        "bids": bids,
+        "won": won,
+        "winners": winners,
+        "payments": payments,
+        "payoffs": payoffs,
+        "efficiencies": efficiencies
+    }
+
+
+def simulate_auction_batch(auction_type: str, slot_strategies: List[str],
+                           valuations: np.ndarray,
+                           rng: np.random.Generator = None) -> Dict[str, np.ndarray]:
+    bids = compute_bid_matrix(auction_type, slot_strategies, valuations, rng)
+    return resolve_bid_matrix(auction_type, valuations, bids)
+
+
 class AuctionSimulator:
     
-    def __init__(self):
+    def __init__(self, seed=None):
+        # `seed` may be an int, None or an existing np.random.Generator.
+        # Valuations and bids use separate child streams, so a strategy that
+        # draws random bids never shifts the valuations of later rounds
+        # (common random numbers across strategy mixes).
+        self.valuation_rng, self.bid_rng = np.random.default_rng(seed).spawn(2)
+        self.seed = int(seed) if isinstance(seed, (int, np.integer)) else None
         self.results_history = []
     
     def run_simulation(self, auction_type: str, num_bidders: int, num_simulations: int,
                       valuation_distribution: str = "uniform", 
                       valuation_params: Dict[str, float] = None,
-                      strategies: List[str] = None) -> Dict[str, Any]:
+                      strategies: List[str] = None,
+                      checkpoint_path: str = None,
+                      checkpoint_every: int = 1000) -> Dict[str, Any]:
         if valuation_params is None:
             valuation_params = {"low": 0, "high": 100}
         
         if strategies is None:
             strategies = ["truthful"] * num_bidders
         
-        results = []
+        if checkpoint_every <= 0 or checkpoint_every % DRAW_CHUNK_SIZE:
+            raise ValueError(
+                f"checkpoint_every must be a positive multiple of {DRAW_CHUNK_SIZE}"
+            )
+        
+        slot_strategies = [strategies[i % len(strategies)] for i in range(num_bidders)]
+        accumulator = SlotAccumulator(slot_strategies)
+        # One row per round: revenue, efficiency, winner slot, winner
+        # valuation, then every slot's bid.
+        records = np.zeros((num_simulations, _RECORD_BIDS + num_bidders))
+        
+        config = {
+            "auction_type": auction_type,
+            "num_bidders": num_bidders,
+            "num_simulations": num_simulations,
+            "valuation_distribution": valuation_distribution,
+            "valuation_params": valuation_params,
+            "slot_strategies": slot_strategies,
+            "seed": self.seed,
+            "draw_chunk_size": DRAW_CHUNK_SIZE
+        }
+        start = 0
+        if checkpoint_path is not None:
+            records_path = checkpoint_path + ".records"
+            if os.path.exists(checkpoint_path):
+                start = self._restore_checkpoint(
+                    checkpoint_path, records_path, config, accumulator, records
+                )
+            elif os.path.exists(records_path):
+                os.remove(records_path)
         
-        for sim in range(num_simulations):
-            valuations = self._generate_valuations(
-                num_bidders, valuation_distribution, valuation_params
+        # Checkpoints land on draw-chunk boundaries, so a resumed run consumes
+        # the random stream exactly like an uninterrupted one.
+        last_checkpoint = start
+        for chunk_start in range(start, num_simulations, DRAW_CHUNK_SIZE):
+            chunk_end = min(chunk_start + DRAW_CHUNK_SIZE, num_simulations)
+            valuation_matrix = generate_valuation_matrix(
+                chunk_end - chunk_start, num_bidders,
+                valuation_distribution, valuation_params, self.valuation_rng
+            )
+            bid_matrix = compute_bid_matrix(
+                auction_type, slot_strategies, valuation_matrix, self.bid_rng
+            )
+            batch = resolve_bid_matrix(auction_type, valuation_matrix, bid_matrix)
+            accumulator.update_batch(
+                bids=bid_matrix,
+                valuations=valuation_matrix,
+                payoffs=batch["payoffs"],
+                won=batch["won"],
+                payments=batch["payments"]
             )
             
-            agents = []
-            for i in range(num_bidders):
-                strategy = strategies[i % len(strategies)]
-                agent = Agent(i, valuations[i], strategy)
-                agents.append(agent)
+            rows = np.arange(chunk_end - chunk_start)
+            chunk_records = records[chunk_start:chunk_end]
+            chunk_records[:, 0] = batch["payments"]
+            chunk_records[:, 1] = batch["efficiencies"]
+            chunk_records[:, 2] = batch["winners"]
+            chunk_records[:, 3] = valuation_matrix[rows, batch["winners"]]
+            chunk_records[:, _RECORD_BIDS:] = bid_matrix
             
-            auction = Auction(auction_type)
-            auction.add_agents(agents)
-            result = auction.run_auction()
-            results.append(result)
+            if (checkpoint_path is not None and chunk_end < num_simulations
+                    and chunk_end - last_checkpoint >= checkpoint_every):
+                self._write_checkpoint(
+                    checkpoint_path, records_path, config, last_checkpoint, chunk_end,
+                    accumulator, records
+                )
+                last_checkpoint = chunk_end
+        
+        # A finished run leaves nothing to resume; removing the checkpoint
+        # keeps a later run on the same path from returning stale results.
+        if checkpoint_path is not None:
+            for path in (checkpoint_path, records_path):
+                if os.path.exists(path):
+                    os.remove(path)
         
-        aggregated = self._aggregate_results(results, auction_type)
+        results = [self._record_result(record, slot_strategies) for record in records]
+        aggregated = self._aggregate_results(results, auction_type, records[:, 0], records[:, 1])
+        aggregated["strategy_stats"] = accumulator.strategy_statistics()
+        # Rounds before `resumed_from` were restored from a checkpoint.
+        aggregated["resumed_from"] = start
         self.results_history.extend(results)
         
         return aggregated
     
-    def _generate_valuations(self, num_bidders: int, distribution: str, 
-                           params: Dict[str, float]) -> List[float]:
-        if distribution == "uniform":
-            low = params.get("low", 0)
-            high = params.get("high", 100)
-            return np.random.uniform(low, high, num_bidders).tolist()
-        elif distribution == "normal":
-            mean = params.get("mean", 50)
-            std = params.get("std", 15)
-            valuations = np.random.normal(mean, std, num_bidders)
-            return np.maximum(valuations, 0).tolist()
-        else:
-            raise ValueError(f"Unknown distribution: {distribution}")
+    def _record_result(self, record: np.ndarray, slot_strategies: List[str]) -> AuctionResult:
+        payment, efficiency, winner_idx, valuation = record[:_RECORD_BIDS]
+        winner_idx = int(winner_idx)
+        winner = Agent(winner_idx, float(valuation), slot_strategies[winner_idx], self.bid_rng)
+        winner.bid = float(record[_RECORD_BIDS + winner_idx])
+        winner.won = True
+        winner.calculate_payoff(float(payment))
+        return AuctionResult(
+            winner=winner,
+            payment=float(payment),
+            all_bids=record[_RECORD_BIDS:].tolist(),
+            revenue=float(payment),
+            efficiency=float(efficiency)
+        )
     
-    def _aggregate_results(self, results: List[AuctionResult], auction_type: str) -> Dict[str, Any]:
-        revenues = [r.revenue for r in results]
-        efficiencies = [r.efficiency for r in results]
-        
-        strategy_wins = {}
-        strategy_payoffs = {}
+    def _write_checkpoint(self, path: str, records_path: str, config: Dict[str, Any],
+                          saved: int, completed: int, accumulator: SlotAccumulator,
+                          records: np.ndarray):
+        # Only rounds since the previous checkpoint are appended, so a run
+        # writes each record once; the checkpoint itself stays small.
+        append_records(records_path, records[saved:completed])
+        meta = {
+            "config": config,
+            "completed": completed,
+            "valuation_rng_state": get_rng_state(self.valuation_rng),
+            "bid_rng_state": get_rng_state(self.bid_rng)
+        }
+        save_checkpoint(path, meta, accumulator.state_arrays())
+    
+    def _restore_checkpoint(self, path: str, records_path: str, config: Dict[str, Any],
+                            accumulator: SlotAccumulator, records: np.ndarray) -> int:
+        meta, arrays = load_checkpoint(path)
+        if meta["config"] != json.loads(json.dumps(config)):
+            raise ValueError(f"Checkpoint {path} was written for a different simulation config")
         
-        for result in results:
-            winner_strategy = result.winner.strategy
-            strategy_wins[winner_strategy] = strategy_wins.get(winner_strategy, 0) + 1
-            
-            pass
+        completed = meta["completed"]
+        accumulator.load_state_arrays(arrays)
+        records[:completed] = load_records(records_path, completed, records.shape[1])
+        set_rng_state(self.valuation_rng, meta["valuation_rng_state"])
+        set_rng_state(self.bid_rng, meta["bid_rng_state"])
+        return completed
+    
+    def _aggregate_results(self, results: List[AuctionResult], auction_type: str,
+                           revenues: np.ndarray, efficiencies: np.ndarray) -> Dict[str, Any]:
+        revenues = revenues.tolist()
+        efficiencies = efficiencies.tolist()
         
         return {
             "auction_type": auction_type,
-            "num_simulations": len(results),
+            "num_simulations": len(revenues),
             "average_revenue": np.mean(revenues),
             "revenue_std": np.std(revenues),
             "average_efficiency": np.mean(efficiencies),
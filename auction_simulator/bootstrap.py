@@ -0,0 +1,131 @@
+"""
+Vectorized bootstrap confidence intervals for simulation outputs.
+"""
+
+import numpy as np
+from typing import Dict, Any, Iterator, Tuple
+
+# Upper bound on resampled elements held in memory at once.
+_MAX_CHUNK_ELEMENTS = 10_000_000
+
+
+def _batch_bounds(n: int, max_points: int) -> np.ndarray:
+    num_batches = n if max_points is None else min(n, max_points)
+    # Start offsets of num_batches contiguous, near-equal batches covering 0..n.
+    return (np.arange(num_batches) * n) // num_batches
+
+
+def _resample_indices(n: int, num_resamples: int, rng: np.random.Generator,
+                      width: int = 1) -> Iterator[np.ndarray]:
+    chunk = max(1, _MAX_CHUNK_ELEMENTS // max(n * width, 1))
+    for start in range(0, num_resamples, chunk):
+        size = min(chunk, num_resamples - start)
+        yield rng.integers(0, n, size=(size, n))
+
+
+def _prepare(values, max_points: int) -> Tuple[np.ndarray, np.ndarray]:
+    values = np.asarray(values, dtype=float)
+    if len(values) == 0:
+        raise ValueError("Cannot bootstrap an empty sample")
+    # Very long runs are collapsed into contiguous batch sums before
+    # resampling; the resampled mean is total sum over total count, so
+    # uneven batches stay unbiased and no round is dropped.
+    bounds = _batch_bounds(len(values), max_points)
+    sums = np.add.reduceat(values, bounds)
+    counts = np.diff(np.append(bounds, len(values))).astype(float)
+    return sums, counts
+
+
+def _bootstrap_means(sums: np.ndarray, counts: np.ndarray, num_resamples: int,
+                     rng: np.random.Generator) -> np.ndarray:
+    return np.concatenate([
+        sums[idx].sum(axis=1) / counts[idx].sum(axis=1)
+        for idx in _resample_indices(len(sums), num_resamples, rng)
+    ])
+
+
+def _interval(observed: float, boot: np.ndarray, confidence: float) -> Dict[str, float]:
+    alpha = (1 - confidence) / 2
+    lower, upper = np.quantile(boot, [alpha, 1 - alpha])
+    return {
+        "mean": float(observed),
+        "lower": float(lower),
+        "upper": float(upper),
+        "std_error": float(np.std(boot, ddof=1)) if len(boot) > 1 else 0.0,
+        "confidence": confidence
+    }
+
+
+def bootstrap_mean_ci(values, num_resamples: int = 2000, confidence: float = 0.95,
+                      max_points: int = 10_000, rng: np.random.Generator = None) -> Dict[str, float]:
+    sums, counts = _prepare(values, max_points)
+    boot = _bootstrap_means(sums, counts, num_resamples, np.random.default_rng(rng))
+    return _interval(sums.sum() / counts.sum(), boot, confidence)
+
+
+def paired_difference_test(values_a, values_b, num_resamples: int = 2000,
+                           confidence: float = 0.95, max_points: int = 10_000,
+                           rng: np.random.Generator = None) -> Dict[str, Any]:
+    # Rounds must line up, i.e. both configurations ran on common random numbers.
+    values_a = np.asarray(values_a, dtype=float)
+    values_b = np.asarray(values_b, dtype=float)
+    if values_a.shape != values_b.shape:
+        raise ValueError("Paired comparison needs samples of equal length")
+
+    sums, counts = _prepare(values_a - values_b, max_points)
+    boot = _bootstrap_means(sums, counts, num_resamples, np.random.default_rng(rng))
+    result = _interval(sums.sum() / counts.sum(), boot, confidence)
+
+    # Two-sided p-value from the bootstrap distribution centred under H0.
+    centred = boot - boot.mean()
+    result["p_value"] = float(np.mean(np.abs(centred) >= abs(result["mean"])))
+    return result
+
+
+def bootstrap_group_means(values, groups, num_resamples: int = 2000,
+                          confidence: float = 0.95, max_points: int = 2_000,
+                          rng: np.random.Generator = None) -> Dict[Any, Dict[str, float]]:
+    values = np.asarray(values, dtype=float)
+    labels, codes = np.unique(np.asarray(groups), return_inverse=True)
+    num_groups = len(labels)
+    n = len(values)
+    if n == 0:
+        raise ValueError("Cannot bootstrap an empty sample")
+
+    # Per-batch group sums and counts, as in _prepare: resampling whole
+    # batches keeps group sizes random, so win counts get intervals too.
+    bounds = _batch_bounds(n, max_points)
+    batch_ids = np.repeat(np.arange(len(bounds)), np.diff(np.append(bounds, n)))
+    cells = batch_ids * num_groups + codes
+    size = len(bounds) * num_groups
+    batch_sums = np.bincount(cells, weights=values, minlength=size).reshape(-1, num_groups)
+    batch_counts = np.bincount(cells, minlength=size).reshape(-1, num_groups).astype(float)
+
+    boot_sums = []
+    boot_counts = []
+    for idx in _resample_indices(len(bounds), num_resamples, np.random.default_rng(rng),
+                                 width=num_groups):
+        boot_sums.append(batch_sums[idx].sum(axis=1))
+        boot_counts.append(batch_counts[idx].sum(axis=1))
+    boot_sums = np.vstack(boot_sums)
+    boot_counts = np.vstack(boot_counts)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        boot_means = boot_sums / boot_counts
+    observed_sums = batch_sums.sum(axis=0)
+    observed_counts = batch_counts.sum(axis=0)
+
+    intervals = {}
+    for g, label in enumerate(labels):
+        boot = boot_means[:, g]
+        boot = boot[~np.isnan(boot)]
+        observed = observed_sums[g] / observed_counts[g]
+        intervals[label] = _interval(observed, boot if len(boot) else np.array([observed]),
+                                     confidence)
+        count_lower, count_upper = np.quantile(
+            boot_counts[:, g], [(1 - confidence) / 2, (1 + confidence) / 2]
+        )
+        intervals[label]["count"] = int(observed_counts[g])
+        intervals[label]["count_lower"] = float(count_lower)
+        intervals[label]["count_upper"] = float(count_upper)
+    return intervals
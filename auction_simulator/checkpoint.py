@@ -0,0 +1,63 @@
+"""
+Crash-safe checkpoints for long-running simulations.
+"""
+
+import json
+import os
+import tempfile
+import numpy as np
+from typing import Dict, Any
+
+
+def save_checkpoint(path: str, meta: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+    # Write to a temporary file in the same directory and atomically swap it in,
+    # so a crash mid-write never leaves a truncated checkpoint behind.
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".checkpoint-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, _meta=np.array(json.dumps(meta)), **arrays)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_checkpoint(path: str):
+    with np.load(path, allow_pickle=False) as data:
+        meta = json.loads(str(data["_meta"]))
+        arrays = {key: data[key] for key in data.files if key != "_meta"}
+    return meta, arrays
+
+
+def append_records(path: str, records: np.ndarray):
+    # Raw float64 rows appended in place. The checkpoint written afterwards
+    # records how many rows are valid, so rows from a crash in between are
+    # simply discarded on resume.
+    with open(path, "ab") as f:
+        np.ascontiguousarray(records, dtype=float).tofile(f)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def load_records(path: str, num_rows: int, num_columns: int) -> np.ndarray:
+    count = num_rows * num_columns
+    records = np.fromfile(path, dtype=float, count=count) if os.path.exists(path) else np.empty(0)
+    if records.size != count:
+        raise ValueError(f"Record file {path} holds fewer than {num_rows} rounds")
+    # Drop any rows past the checkpoint so later appends line up.
+    with open(path, "r+b") as f:
+        f.truncate(records.nbytes)
+    return records.reshape(num_rows, num_columns)
+
+
+def get_rng_state(rng: np.random.Generator) -> Dict[str, Any]:
+    # Bit generator states are plain dicts of (arbitrarily large) ints.
+    return rng.bit_generator.state
+
+
+def set_rng_state(rng: np.random.Generator, state: Dict[str, Any]):
+    rng.bit_generator.state = state
@@ -0,0 +1,238 @@
+"""
+Combinatorial (package-bidding) auctions with VCG payments.
+"""
+
+import numpy as np
+from typing import List, Tuple, Dict, Any, Iterable
+
+
+def items_to_mask(items: Iterable[int]) -> int:
+    mask = 0
+    for item in items:
+        mask |= 1 << int(item)
+    return mask
+
+
+def mask_to_items(mask: int) -> List[int]:
+    return [i for i in range(mask.bit_length()) if mask >> i & 1]
+
+
+class CombinatorialResult:
+
+    def __init__(self, allocation: Dict[int, List[int]], payments: Dict[int, float],
+                 revenue: float, welfare: float, exact: bool):
+        self.allocation = allocation
+        self.payments = payments
+        self.revenue = revenue
+        self.welfare = welfare
+        self.exact = exact
+
+
+class CombinatorialAuction:
+
+    def __init__(self, num_items: int, bid_language: str = "XOR", exact_item_limit: int = 14):
+        if bid_language not in ("XOR", "OR"):
+            raise ValueError(f"Unknown bid language: {bid_language}")
+        self.num_items = num_items
+        self.bid_language = bid_language
+        self.exact_item_limit = exact_item_limit
+        self.bids: List[Tuple[int, int, float]] = []
+        self.result = None
+
+    def add_bid(self, bidder_id: int, items: Iterable[int], amount: float):
+        items = list(items)
+        mask = items_to_mask(items)
+        if mask == 0 or mask >> self.num_items:
+            raise ValueError(f"Bundle {sorted(items)} is not a subset of {self.num_items} items")
+        if amount > 0:
+            self.bids.append((bidder_id, mask, float(amount)))
+
+    def run_auction(self) -> CombinatorialResult:
+        if not self.bids:
+            raise ValueError("No bids in auction")
+
+        if self.num_items <= self.exact_item_limit:
+            winners, welfare_without = self._solve_exact()
+            exact = True
+        else:
+            winners, welfare_without = self._solve_greedy()
+            exact = False
+
+        allocation: Dict[int, List[int]] = {}
+        bidder_values: Dict[int, float] = {}
+        for bidder_id, mask, amount in winners:
+            allocation.setdefault(bidder_id, []).extend(mask_to_items(mask))
+            bidder_values[bidder_id] = bidder_values.get(bidder_id, 0.0) + amount
+        welfare = sum(bidder_values.values())
+
+        # VCG: each winner pays the welfare the others lose because of them.
+        payments = {
+            bidder_id: max(welfare_without[bidder_id] - (welfare - value), 0.0)
+            for bidder_id, value in bidder_values.items()
+        }
+        for bidder_id in allocation:
+            allocation[bidder_id].sort()
+
+        self.result = CombinatorialResult(
+            allocation=allocation,
+            payments=payments,
+            revenue=sum(payments.values()),
+            welfare=welfare,
+            exact=exact
+        )
+        return self.result
+
+    def _bid_groups(self) -> List[List[Tuple[int, int, float]]]:
+        # Under XOR a bidder wins at most one bundle, so all of their bids form
+        # one group; under OR every atomic bid is its own group. Groups of the
+        # same bidder are kept contiguous for the prefix/suffix VCG trick.
+        ordered = sorted(self.bids, key=lambda bid: bid[0])
+        groups = []
+        for bid in ordered:
+            if self.bid_language == "XOR" and groups and groups[-1][0][0] == bid[0]:
+                groups[-1].append(bid)
+            else:
+                groups.append([bid])
+        return groups
+
+    def _solve_exact(self) -> Tuple[List[Tuple[int, int, float]], Dict[int, float]]:
+        groups = self._bid_groups()
+        full = (1 << self.num_items) - 1
+        subsets = np.arange(full + 1)
+
+        def extend(table: np.ndarray, group) -> np.ndarray:
+            # table[S] is the best welfare using only items in S.
+            new = table.copy()
+            for _, mask, amount in group:
+                fits = subsets[(subsets & mask) == mask]
+                new[fits] = np.maximum(new[fits], amount + table[fits ^ mask])
+            return new
+
+        prefix = [np.zeros(full + 1)]
+        for group in groups:
+            prefix.append(extend(prefix[-1], group))
+        suffix = [np.zeros(full + 1)]
+        for group in reversed(groups):
+            suffix.append(extend(suffix[-1], group))
+        suffix.reverse()
+
+        winners = []
+        remaining = full
+        for k in range(len(groups), 0, -1):
+            target = prefix[k][remaining]
+            if target == prefix[k - 1][remaining]:
+                continue
+            for bid in groups[k - 1]:
+                _, mask, amount = bid
+                if (remaining & mask) == mask and amount + prefix[k - 1][remaining ^ mask] == target:
+                    winners.append(bid)
+                    remaining ^= mask
+                    break
+
+        # Welfare without bidder i combines the DP tables of the groups before
+        # and after i's groups over complementary item sets, so no re-solve.
+        winning_bidders = {bid[0] for bid in winners}
+        spans: Dict[int, List[int]] = {}
+        for k, group in enumerate(groups):
+            span = spans.setdefault(group[0][0], [k, k])
+            span[1] = k
+        welfare_without = {}
+        for bidder_id in winning_bidders:
+            first, last = spans[bidder_id]
+            welfare_without[bidder_id] = float(np.max(prefix[first] + suffix[last + 1][full ^ subsets]))
+
+        return winners, welfare_without
+
+    def _solve_greedy(self) -> Tuple[List[Tuple[int, int, float]], Dict[int, float]]:
+        # Lehmann-O'Callaghan-Shoham ordering by value per sqrt(bundle size).
+        order = sorted(
+            self.bids,
+            key=lambda bid: bid[2] / np.sqrt(bin(bid[1]).count("1")),
+            reverse=True
+        )
+
+        def allocate(excluded=None):
+            taken = 0
+            winning_bidders = set()
+            chosen = []
+            for bid in order:
+                bidder_id, mask, _ = bid
+                if bidder_id == excluded or taken & mask:
+                    continue
+                if self.bid_language == "XOR" and bidder_id in winning_bidders:
+                    continue
+                chosen.append(bid)
+                taken |= mask
+                winning_bidders.add(bidder_id)
+            return chosen
+
+        winners = allocate()
+        welfare_without = {
+            bidder_id: sum(amount for _, _, amount in allocate(excluded=bidder_id))
+            for bidder_id in {bid[0] for bid in winners}
+        }
+        return winners, welfare_without
+
+
+def generate_package_bids(num_bidders: int, num_items: int, bundles_per_bidder: int = 3,
+                          max_bundle_size: int = 3, valuation_params: Dict[str, float] = None,
+                          synergy: float = 0.2,
+                          rng: np.random.Generator = None) -> List[Tuple[int, List[int], float]]:
+    if valuation_params is None:
+        valuation_params = {"low": 0, "high": 100}
+
+    low = valuation_params.get("low", 0)
+    high = valuation_params.get("high", 100)
+    max_bundle_size = min(max_bundle_size, num_items)
+    rng = np.random.default_rng(rng)
+
+    item_values = rng.uniform(low, high, (num_bidders, num_items))
+    sizes = rng.integers(1, max_bundle_size + 1, (num_bidders, bundles_per_bidder))
+    # Random item orderings per bundle; the first `size` items form the bundle.
+    orderings = np.argsort(rng.random((num_bidders, bundles_per_bidder, num_items)), axis=2)
+
+    bids = []
+    for bidder_id in range(num_bidders):
+        for j in range(bundles_per_bidder):
+            items = orderings[bidder_id, j, :sizes[bidder_id, j]]
+            value = item_values[bidder_id, items].sum() * (1 + synergy * (len(items) - 1))
+            bids.append((bidder_id, items.tolist(), float(value)))
+    return bids
+
+
+class CombinatorialSimulator:
+
+    def __init__(self, seed=None):
+        self.rng = np.random.default_rng(seed)
+        self.results_history = []
+
+    def run_simulation(self, num_items: int, num_bidders: int, num_simulations: int,
+                       bid_language: str = "XOR", bundles_per_bidder: int = 3,
+                       max_bundle_size: int = 3, valuation_params: Dict[str, float] = None,
+                       synergy: float = 0.2, exact_item_limit: int = 14) -> Dict[str, Any]:
+        results = []
+
+        for sim in range(num_simulations):
+            auction = CombinatorialAuction(num_items, bid_language, exact_item_limit)
+            for bidder_id, items, amount in generate_package_bids(
+                num_bidders, num_items, bundles_per_bidder, max_bundle_size,
+                valuation_params, synergy, self.rng
+            ):
+                auction.add_bid(bidder_id, items, amount)
+            results.append(auction.run_auction())
+
+        revenues = [r.revenue for r in results]
+        welfares = [r.welfare for r in results]
+        self.results_history.extend(results)
+
+        return {
+            "auction_type": f"combinatorial_{bid_language.lower()}",
+            "num_simulations": len(results),
+            "average_revenue": np.mean(revenues),
+            "revenue_std": np.std(revenues),
+            "average_welfare": np.mean(welfares),
+            "welfare_std": np.std(welfares),
+            "all_revenues": revenues,
+            "all_welfares": welfares,
+            "results": results
+        }
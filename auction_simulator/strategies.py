@@ -8,8 +8,12 @@ from typing import Dict, Any
 
 class BiddingStrategy:
     
-    def __init__(self, strategy_name: str):
+    def __init__(self, strategy_name: str, rng: np.random.Generator = None):
         self.strategy_name = strategy_name
+        # Without a generator, random bids use numpy's global state, so
+        # constructing a strategy per bid stays cheap and np.random.seed
+        # still reproduces unseeded runs.
+        self.rng = np.random if rng is None else np.random.default_rng(rng)
     
     def calculate_bid(self, valuation: float, auction_type: str, num_bidders: int, **kwargs) -> float:
         if self.strategy_name == "truthful":
@@ -25,6 +29,14 @@ class BiddingStrategy:
         else:
             return self._truthful_bid(valuation, auction_type)
     
+    def calculate_bids(self, valuations: np.ndarray, auction_type: str, num_bidders: int) -> np.ndarray:
+        valuations = np.asarray(valuations, dtype=float)
+        if self.strategy_name == "random":
+            return self.rng.uniform(0, valuations)
+        
+        # Every other strategy is a fixed multiple of the valuation.
+        return valuations * self.calculate_bid(1.0, auction_type, num_bidders)
+    
     def _truthful_bid(self, valuation: float, auction_type: str) -> float:
         return valuation
     
@@ -42,7 +54,7 @@ class BiddingStrategy:
             return valuation * (1 - shade_factor)
     
     def _random_bid(self, valuation: float) -> float:
-        return np.random.uniform(0, valuation)
+        return self.rng.uniform(0, valuation)
     
     def _optimal_first_price_bid(self, valuation: float, num_bidders: int) -> float:
         if num_bidders <= 1:
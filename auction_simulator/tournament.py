@@ -0,0 +1,192 @@
+"""
+Evolutionary tournament over populations of bidding strategies.
+"""
+
+import numpy as np
+from itertools import combinations_with_replacement
+from math import factorial
+from typing import List, Dict, Any, Tuple
+
+from .accumulators import SlotAccumulator
+from .auctions import simulate_auction_batch
+from .strategies import get_available_strategies
+from .utils import generate_valuation_matrix
+
+
+def enumerate_count_profiles(num_strategies: int, num_players: int) -> np.ndarray:
+    # Symmetric games only depend on how many players use each strategy, so
+    # profiles are count vectors instead of ordered assignments.
+    profiles = []
+    for combo in combinations_with_replacement(range(num_strategies), num_players):
+        profiles.append(np.bincount(combo, minlength=num_strategies))
+    return np.array(profiles, dtype=np.int64).reshape(-1, num_strategies)
+
+
+def multinomial_coefficients(profiles: np.ndarray) -> np.ndarray:
+    totals = profiles.sum(axis=1)
+    return np.array([
+        factorial(int(n)) / np.prod([factorial(int(c)) for c in row])
+        for n, row in zip(totals, profiles)
+    ])
+
+
+class StrategyTournament:
+
+    def __init__(self, auction_type: str, num_bidders: int, rounds_per_profile: int = 1000,
+                 valuation_distribution: str = "uniform",
+                 valuation_params: Dict[str, float] = None,
+                 strategies: List[str] = None,
+                 seed=None):
+        if num_bidders < 1:
+            raise ValueError("Tournament needs at least one bidder")
+        if valuation_params is None:
+            valuation_params = {"low": 0, "high": 100}
+        if strategies is None:
+            strategies = list(get_available_strategies().keys())
+
+        self.auction_type = auction_type
+        self.num_bidders = num_bidders
+        self.rounds_per_profile = rounds_per_profile
+        self.valuation_distribution = valuation_distribution
+        self.valuation_params = valuation_params
+        self.strategies = list(strategies)
+        # Valuations and each profile's random bids get their own stream
+        # derived from the seed, so a memoized payoff never depends on which
+        # profiles were simulated before it.
+        self.entropy = np.random.SeedSequence(seed).entropy
+        self._valuations = None
+        self._profile_payoffs: Dict[Tuple[int, ...], np.ndarray] = {}
+        self._opponent_profiles = None
+        self._opponent_coefficients = None
+        self._deviation_payoffs = None
+
+    def profile_payoffs(self, counts) -> np.ndarray:
+        key = tuple(int(c) for c in counts)
+        if len(key) != len(self.strategies) or sum(key) != self.num_bidders:
+            raise ValueError(f"Invalid profile {key} for {self.num_bidders} bidders")
+
+        if key not in self._profile_payoffs:
+            self._profile_payoffs[key] = self._simulate_profile(key)
+        return self._profile_payoffs[key]
+
+    def _simulate_profile(self, counts: Tuple[int, ...]) -> np.ndarray:
+        slot_strategies = []
+        for strategy, count in zip(self.strategies, counts):
+            slot_strategies.extend([strategy] * count)
+
+        # Every profile is played on the same valuations (common random
+        # numbers), so payoff differences come from the strategies, not noise.
+        if self._valuations is None:
+            self._valuations = generate_valuation_matrix(
+                self.rounds_per_profile, self.num_bidders,
+                self.valuation_distribution, self.valuation_params,
+                np.random.default_rng(np.random.SeedSequence(self.entropy, spawn_key=(0,)))
+            )
+        valuations = self._valuations
+        bid_rng = np.random.default_rng(
+            np.random.SeedSequence(self.entropy, spawn_key=(1, *counts))
+        )
+        batch = simulate_auction_batch(self.auction_type, slot_strategies, valuations, bid_rng)
+
+        accumulator = SlotAccumulator(slot_strategies)
+        accumulator.update_batch(
+            bids=batch["bids"],
+            valuations=valuations,
+            payoffs=batch["payoffs"],
+            won=batch["won"],
+            payments=batch["payments"]
+        )
+        stats = accumulator.strategy_statistics()
+
+        # Strategies absent from the profile have no defined payoff.
+        return np.array([
+            stats[s]["expected_payoff"] if s in stats else np.nan
+            for s in self.strategies
+        ])
+
+    def payoff_table(self) -> Dict[Tuple[int, ...], np.ndarray]:
+        for counts in enumerate_count_profiles(len(self.strategies), self.num_bidders):
+            self.profile_payoffs(counts)
+        return dict(self._profile_payoffs)
+
+    def _prepare_deviation_payoffs(self):
+        if self._deviation_payoffs is not None:
+            return
+
+        num_strategies = len(self.strategies)
+        opponents = enumerate_count_profiles(num_strategies, self.num_bidders - 1)
+        deviation = np.empty((len(opponents), num_strategies))
+        for p, others in enumerate(opponents):
+            for i in range(num_strategies):
+                counts = others.copy()
+                counts[i] += 1
+                deviation[p, i] = self.profile_payoffs(counts)[i]
+
+        self._opponent_profiles = opponents
+        self._opponent_coefficients = multinomial_coefficients(opponents)
+        self._deviation_payoffs = deviation
+
+    def fitness(self, shares) -> np.ndarray:
+        # Expected payoff of each strategy against num_bidders - 1 opponents
+        # drawn independently from the population.
+        self._prepare_deviation_payoffs()
+        shares = np.asarray(shares, dtype=float)
+        probabilities = self._opponent_coefficients * np.prod(
+            shares ** self._opponent_profiles, axis=1
+        )
+        return probabilities @ self._deviation_payoffs
+
+    def _initial_shares(self, initial_shares) -> np.ndarray:
+        if initial_shares is None:
+            return np.full(len(self.strategies), 1.0 / len(self.strategies))
+
+        shares = np.asarray(initial_shares, dtype=float)
+        if shares.shape != (len(self.strategies),) or np.any(shares < 0) or shares.sum() <= 0:
+            raise ValueError("Initial shares must be a non-negative vector over strategies")
+        return shares / shares.sum()
+
+    def replicator_dynamics(self, initial_shares=None, iterations: int = 500,
+                            tolerance: float = 1e-10,
+                            background_fitness: float = 1.0) -> Dict[str, Any]:
+        shares = self._initial_shares(initial_shares)
+        history = [shares]
+
+        for _ in range(iterations):
+            # Discrete-time replicator update x_i * f_i / f_bar, with a fixed
+            # background fitness keeping every f_i positive.
+            fitness = self.fitness(shares) + background_fitness
+            if np.any(fitness <= 0):
+                raise ValueError("Background fitness too small for negative payoffs")
+            new_shares = shares * fitness / np.dot(shares, fitness)
+            history.append(new_shares)
+            converged = np.abs(new_shares - shares).max() < tolerance
+            shares = new_shares
+            if converged:
+                break
+
+        return self._dynamics_result(shares, history)
+
+    def best_response_dynamics(self, initial_shares=None, iterations: int = 500) -> Dict[str, Any]:
+        shares = self._initial_shares(initial_shares)
+        history = [shares]
+
+        # Fictitious play: move towards the current best response with a 1/t step.
+        for t in range(1, iterations + 1):
+            best = np.argmax(self.fitness(shares))
+            target = np.zeros_like(shares)
+            target[best] = 1.0
+            shares = shares + (target - shares) / (t + 1)
+            history.append(shares)
+
+        return self._dynamics_result(shares, history)
+
+    def _dynamics_result(self, shares: np.ndarray, history: List[np.ndarray]) -> Dict[str, Any]:
+        fitness = self.fitness(shares)
+        return {
+            "strategies": self.strategies,
+            "final_shares": dict(zip(self.strategies, shares.tolist())),
+            "final_fitness": dict(zip(self.strategies, fitness.tolist())),
+            "share_history": np.array(history),
+            "iterations": len(history) - 1,
+            "profiles_simulated": len(self._profile_payoffs)
+        }
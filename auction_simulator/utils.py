@@ -5,17 +5,35 @@ from typing import List, Dict, Any
 
 def generate_random_valuations(num_bidders: int, distribution: str = "uniform", 
                              low: float = 0, high: float = 100, 
-                             mean: float = 50, std: float = 15) -> List[float]:
-
+                             mean: float = 50, std: float = 15,
+                             rng: np.random.Generator = None) -> List[float]:
+    rng = np.random.default_rng(rng)
     if distribution == "uniform":
-        return np.random.uniform(low, high, num_bidders).tolist()
+        return rng.uniform(low, high, num_bidders).tolist()
     elif distribution == "normal":
-        valuations = np.random.normal(mean, std, num_bidders)
+        valuations = rng.normal(mean, std, num_bidders)
         return np.maximum(valuations, 0).tolist()
     else:
         raise ValueError(f"Unknown distribution: {distribution}")
 
 
+def generate_valuation_matrix(num_rounds: int, num_bidders: int, distribution: str = "uniform",
+                              params: Dict[str, float] = None,
+                              rng: np.random.Generator = None) -> np.ndarray:
+    if params is None:
+        params = {}
+    
+    rng = np.random.default_rng(rng)
+    shape = (num_rounds, num_bidders)
+    if distribution == "uniform":
+        return rng.uniform(params.get("low", 0), params.get("high", 100), shape)
+    elif distribution == "normal":
+        valuations = rng.normal(params.get("mean", 50), params.get("std", 15), shape)
+        return np.maximum(valuations, 0)
+    else:
+        raise ValueError(f"Unknown distribution: {distribution}")
+
+
 def calculate_theoretical_revenue(auction_type: str, num_bidders: int, 
                                 valuation_range: tuple = (0, 100)) -> float:
     low, high = valuation_range
@@ -48,23 +66,6 @@ def results_to_dataframe(results: List[Any]) -> pd.DataFrame:
     return pd.DataFrame(data)
 
 
-def calculate_strategy_statistics(df: pd.DataFrame) -> Dict[str, Dict[str, float]]:
-    stats = {}
-    
-    for strategy in df['winner_strategy'].unique():
-        strategy_data = df[df['winner_strategy'] == strategy]
-        
-        stats[strategy] = {
-            'win_rate': len(strategy_data) / len(df),
-            'avg_payoff': strategy_data['winner_payoff'].mean(),
-            'avg_bid': strategy_data['winner_bid'].mean(),
-            'avg_valuation': strategy_data['winner_valuation'].mean(),
-            'total_wins': len(strategy_data)
-        }
-    
-    return stats
-
-
 def calculate_auction_efficiency(results: List[Any]) -> Dict[str, float]:
     efficiencies = [r.efficiency for r in results]
     
@@ -1,25 +1,71 @@
 """
 Game logic for Auction Strategy Game Simulator
 """
-from auction_simulator import Agent, AuctionSimulator, get_available_strategies
+from auction_simulator import Agent, AuctionSimulator, StrategyTournament, get_available_strategies
+from auction_simulator.bootstrap import paired_difference_test
 from typing import Dict, Any, List
 import pandas as pd
 import numpy as np
 
 def run_auction_simulation(auction_type: str, num_bidders: int, num_simulations: int,
                           valuation_dist: str, valuation_params: Dict[str, float],
-                          strategies: List[str]):
-    simulator = AuctionSimulator()
+                          strategies: List[str], checkpoint_path: str = None,
+                          checkpoint_every: int = 1000, seed=None):
+    simulator = AuctionSimulator(seed=seed)
     results = simulator.run_simulation(
         auction_type=auction_type,
         num_bidders=num_bidders,
         num_simulations=num_simulations,
         valuation_distribution=valuation_dist,
         valuation_params=valuation_params,
-        strategies=strategies
+        strategies=strategies,
+        checkpoint_path=checkpoint_path,
+        checkpoint_every=checkpoint_every
     )
     return results
 
+def run_auction_comparison(auction_types: List[str], num_bidders: int, num_simulations: int,
+                           valuation_dist: str, valuation_params: Dict[str, float],
+                           strategies: List[str], seed: int = 0):
+    results_dict = {}
+    for auction_type in auction_types:
+        # Same seed for every format so they see the same valuations
+        # (common random numbers).
+        results_dict[auction_type] = run_auction_simulation(
+            auction_type, num_bidders, num_simulations,
+            valuation_dist, valuation_params, strategies, seed=seed
+        )
+    
+    comparisons = {}
+    for i, type_a in enumerate(auction_types):
+        for type_b in auction_types[i + 1:]:
+            comparisons[(type_a, type_b)] = {
+                metric: paired_difference_test(
+                    results_dict[type_a][f"all_{metric}"], results_dict[type_b][f"all_{metric}"]
+                )
+                for metric in ("revenues", "efficiencies")
+            }
+    return results_dict, comparisons
+
+def run_strategy_tournament(auction_type: str, num_bidders: int, rounds_per_profile: int,
+                            valuation_dist: str, valuation_params: Dict[str, float],
+                            dynamics: str = "replicator", iterations: int = 500,
+                            seed=None):
+    tournament = StrategyTournament(
+        auction_type=auction_type,
+        num_bidders=num_bidders,
+        rounds_per_profile=rounds_per_profile,
+        valuation_distribution=valuation_dist,
+        valuation_params=valuation_params,
+        seed=seed
+    )
+    if dynamics == "replicator":
+        return tournament.replicator_dynamics(iterations=iterations)
+    elif dynamics == "best_response":
+        return tournament.best_response_dynamics(iterations=iterations)
+    else:
+        raise ValueError(f"Unknown dynamics: {dynamics}")
+
 def create_results_dataframe(auction_results: List[Any]) -> pd.DataFrame:
     data = []
     for i, result in enumerate(auction_results):
@@ -36,13 +82,19 @@ def create_results_dataframe(auction_results: List[Any]) -> pd.DataFrame:
         })
     return pd.DataFrame(data)
 
-def calculate_strategy_stats(df: pd.DataFrame) -> pd.DataFrame:
-    stats = df.groupby('winner_strategy').agg({
-        'winner_payoff': ['count', 'mean', 'std'],
-        'payment': 'mean',
-        'winner_valuation': 'mean',
-        'winner_bid': 'mean'
-    }).round(2)
-    stats.columns = ['Wins', 'Avg Payoff', 'Payoff Std', 'Avg Payment', 'Avg Valuation', 'Avg Bid']
-    stats['Win Rate'] = (stats['Wins'] / len(df) * 100).round(1)
+def create_strategy_stats_table(strategy_stats: Dict[str, Dict[str, float]]) -> pd.DataFrame:
+    stats = pd.DataFrame.from_dict(strategy_stats, orient='index').round(2)
+    stats['win_rate'] = (stats['win_rate'] * 100).round(1)
+    stats = stats.rename(columns={
+        'participations': 'Participations',
+        'total_wins': 'Wins',
+        'win_rate': 'Win Rate',
+        'expected_payoff': 'Expected Payoff',
+        'payoff_std': 'Payoff Std',
+        'avg_winning_payoff': 'Avg Winning Payoff',
+        'avg_payment': 'Avg Payment',
+        'avg_valuation': 'Avg Valuation',
+        'avg_bid': 'Avg Bid'
+    })
+    stats.index.name = 'strategy'
     return stats.reset_index()
\ No newline at end of file
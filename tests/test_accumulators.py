@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from auction_simulator import Agent, Auction, simulate_auction_batch
+from auction_simulator.accumulators import SlotAccumulator
+
+
+SLOTS = ["truthful", "conservative", "truthful", "aggressive"]
+
+
+def _batch(seed, num_rounds=400, auction_type="first_price"):
+    valuations = np.random.default_rng(seed).uniform(0, 100, (num_rounds, len(SLOTS)))
+    return valuations, simulate_auction_batch(auction_type, SLOTS, valuations, seed)
+
+
+def test_statistics_match_per_agent_brute_force():
+    valuations, batch = _batch(0)
+    accumulator = SlotAccumulator(SLOTS)
+    accumulator.update_batch(batch["bids"], valuations, batch["payoffs"],
+                             batch["won"], batch["payments"])
+    stats = accumulator.strategy_statistics()
+
+    # Play every round with Agent objects and average over all participations,
+    # losers included with a payoff of zero.
+    payoffs = {s: [] for s in SLOTS}
+    wins = {s: 0 for s in SLOTS}
+    for row in range(len(valuations)):
+        agents = [Agent(i, valuations[row, i], s) for i, s in enumerate(SLOTS)]
+        auction = Auction("first_price")
+        auction.add_agents(agents)
+        auction.run_auction(bids=batch["bids"][row].tolist())
+        for agent in agents:
+            payoffs[agent.strategy].append(agent.payoff)
+            wins[agent.strategy] += agent.won
+
+    for strategy in dict.fromkeys(SLOTS):
+        assert stats[strategy]["participations"] == len(payoffs[strategy])
+        assert stats[strategy]["total_wins"] == wins[strategy]
+        assert stats[strategy]["win_rate"] == pytest.approx(wins[strategy] / len(payoffs[strategy]))
+        assert stats[strategy]["expected_payoff"] == pytest.approx(np.mean(payoffs[strategy]))
+        assert stats[strategy]["payoff_std"] == pytest.approx(np.std(payoffs[strategy]))
+
+
+def test_update_and_update_batch_agree():
+    valuations, batch = _batch(1, auction_type="second_price")
+    per_round = SlotAccumulator(SLOTS)
+    for row in range(len(valuations)):
+        per_round.update(batch["bids"][row], valuations[row], batch["payoffs"][row],
+                         batch["won"][row], batch["payments"][row])
+    batched = SlotAccumulator(SLOTS)
+    batched.update_batch(batch["bids"], valuations, batch["payoffs"],
+                         batch["won"], batch["payments"])
+
+    for name, value in per_round.state_arrays().items():
+        np.testing.assert_allclose(batched.state_arrays()[name], value)
+    batched_stats = batched.strategy_statistics()
+    for strategy, stats in per_round.strategy_statistics().items():
+        assert stats == pytest.approx(batched_stats[strategy])
+
+
+def test_load_state_rejects_wrong_slot_count():
+    state = SlotAccumulator(SLOTS[:3]).state_arrays()
+    with pytest.raises(ValueError):
+        SlotAccumulator(SLOTS).load_state_arrays(state)
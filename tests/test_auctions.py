@@ -0,0 +1,26 @@
+import numpy as np
+
+from auction_simulator import Agent, AuctionSimulator
+
+
+def _bids(strategies, seed=0):
+    results = AuctionSimulator(seed=seed).run_simulation(
+        "second_price", 3, 2500, strategies=strategies
+    )["results"]
+    return np.array([r.all_bids for r in results])
+
+
+def test_random_bidders_do_not_shift_valuations():
+    # Truthful bids are the valuations, so the first two columns must match
+    # in every draw chunk whether or not the third slot bids randomly.
+    truthful = _bids(["truthful"])
+    mixed = _bids(["truthful", "truthful", "random"])
+    np.testing.assert_array_equal(mixed[:, :2], truthful[:, :2])
+
+
+def test_unseeded_random_bids_follow_global_seed():
+    def bids():
+        np.random.seed(3)
+        return [Agent(0, 50.0, "random").place_bid("first_price", 2) for _ in range(5)]
+
+    assert bids() == bids()
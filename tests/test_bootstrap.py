@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from auction_simulator.bootstrap import (
+    bootstrap_mean_ci, paired_difference_test, bootstrap_group_means
+)
+
+
+@pytest.mark.parametrize("n", [10, 9999, 19999, 25001])
+def test_mean_ci_reports_full_sample_mean(n):
+    values = np.arange(n, dtype=float)
+    ci = bootstrap_mean_ci(values, num_resamples=200, rng=0)
+
+    assert ci["mean"] == pytest.approx(values.mean())
+    assert ci["lower"] <= ci["mean"] <= ci["upper"]
+
+
+def test_paired_difference_uses_full_sample():
+    rng = np.random.default_rng(0)
+    base = rng.normal(50, 10, 19999)
+    shifted = base + 2.0 + rng.normal(0, 0.1, base.shape)
+
+    result = paired_difference_test(shifted, base, num_resamples=500, rng=1)
+
+    assert result["mean"] == pytest.approx((shifted - base).mean())
+    assert result["lower"] <= 2.0 <= result["upper"]
+    assert result["p_value"] < 0.01
+
+
+def test_group_means_match_exact_groupby():
+    rng = np.random.default_rng(0)
+    values = rng.random(20001)
+    groups = rng.choice(["a", "b", "c"], len(values))
+
+    intervals = bootstrap_group_means(values, groups, num_resamples=300, rng=0)
+
+    assert sum(i["count"] for i in intervals.values()) == len(values)
+    for label, interval in intervals.items():
+        mask = groups == label
+        assert interval["mean"] == pytest.approx(values[mask].mean())
+        assert interval["count"] == mask.sum()
+        assert interval["lower"] <= interval["mean"] <= interval["upper"]
+        assert interval["count_lower"] <= interval["count"] <= interval["count_upper"]
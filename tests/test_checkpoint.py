@@ -0,0 +1,97 @@
+import os
+
+import pytest
+
+from auction_simulator import AuctionSimulator
+from auction_simulator.checkpoint import load_checkpoint
+
+
+class _Preempted(Exception):
+    pass
+
+
+def _run(seed, path, num_simulations=2500, checkpoint_every=1000):
+    return AuctionSimulator(seed=seed).run_simulation(
+        "first_price", 4, num_simulations,
+        strategies=["truthful", "random"],
+        checkpoint_path=path, checkpoint_every=checkpoint_every
+    )
+
+
+def _interrupt_after_first_checkpoint(monkeypatch, seed, path):
+    original = AuctionSimulator._write_checkpoint
+
+    def write_then_die(self, *args, **kwargs):
+        original(self, *args, **kwargs)
+        raise _Preempted()
+
+    monkeypatch.setattr(AuctionSimulator, "_write_checkpoint", write_then_die)
+    with pytest.raises(_Preempted):
+        _run(seed, path)
+    monkeypatch.undo()
+
+
+def test_resume_matches_uninterrupted_run(tmp_path, monkeypatch):
+    path = str(tmp_path / "run.npz")
+    expected = _run(7, None)
+
+    _interrupt_after_first_checkpoint(monkeypatch, 7, path)
+    meta, _ = load_checkpoint(path)
+    assert meta["completed"] == 1000
+
+    resumed = _run(7, path)
+    assert resumed["all_revenues"] == expected["all_revenues"]
+    assert resumed["strategy_stats"] == expected["strategy_stats"]
+    assert resumed["resumed_from"] == 1000
+    assert len(resumed["results"]) == 2500
+    assert ([r.all_bids for r in resumed["results"]]
+            == [r.all_bids for r in expected["results"]])
+
+
+def test_completed_run_removes_checkpoint(tmp_path):
+    path = str(tmp_path / "run.npz")
+    first = _run(1, path)
+    assert not os.path.exists(path)
+
+    second = _run(2, path)
+    assert len(second["results"]) == 2500
+    assert second["average_revenue"] != first["average_revenue"]
+
+
+def test_resume_with_different_seed_is_rejected(tmp_path, monkeypatch):
+    path = str(tmp_path / "run.npz")
+    _interrupt_after_first_checkpoint(monkeypatch, 7, path)
+
+    with pytest.raises(ValueError):
+        _run(8, path)
+
+
+def test_seeded_results_do_not_depend_on_checkpoint_interval(tmp_path, monkeypatch):
+    expected = _run(7, None)
+    assert _run(7, None, checkpoint_every=2000)["all_revenues"] == expected["all_revenues"]
+
+    path = str(tmp_path / "run.npz")
+    _interrupt_after_first_checkpoint(monkeypatch, 7, path)
+    resumed = _run(7, path, checkpoint_every=3000)
+    assert resumed["all_revenues"] == expected["all_revenues"]
+
+
+def test_checkpoint_interval_must_be_whole_draw_chunks():
+    with pytest.raises(ValueError):
+        _run(7, None, checkpoint_every=300)
+
+
+def test_checkpoint_writes_each_round_once(tmp_path, monkeypatch):
+    path = str(tmp_path / "run.npz")
+    sizes = []
+    original = AuctionSimulator._write_checkpoint
+
+    def record_sizes(self, *args, **kwargs):
+        original(self, *args, **kwargs)
+        sizes.append(os.path.getsize(path + ".records"))
+
+    monkeypatch.setattr(AuctionSimulator, "_write_checkpoint", record_sizes)
+    _run(7, path, num_simulations=4500)
+    # Four bids plus four summary fields per round, 8 bytes each.
+    assert sizes == [1000 * 8 * 8, 2000 * 8 * 8, 3000 * 8 * 8, 4000 * 8 * 8]
+    assert not os.path.exists(path + ".records")
@@ -0,0 +1,110 @@
+from itertools import product
+
+import numpy as np
+import pytest
+
+from auction_simulator.combinatorial import (
+    CombinatorialAuction, generate_package_bids, items_to_mask
+)
+
+
+def _brute_force_welfare(bids, bid_language, excluded=None):
+    best = 0.0
+    for chosen in product([False, True], repeat=len(bids)):
+        taken = 0
+        bidders = set()
+        welfare = 0.0
+        feasible = True
+        for use, (bidder_id, mask, amount) in zip(chosen, bids):
+            if not use:
+                continue
+            if bidder_id == excluded or taken & mask:
+                feasible = False
+                break
+            if bid_language == "XOR" and bidder_id in bidders:
+                feasible = False
+                break
+            taken |= mask
+            bidders.add(bidder_id)
+            welfare += amount
+        if feasible:
+            best = max(best, welfare)
+    return best
+
+
+def _bundle_value(bids, bidder_id, items, bid_language):
+    # Best value of the bidder's disjoint bids exactly covering their items.
+    target = items_to_mask(items)
+    own = [(mask, amount) for b, mask, amount in bids if b == bidder_id]
+    best = None
+    for chosen in product([False, True], repeat=len(own)):
+        if bid_language == "XOR" and sum(chosen) > 1:
+            continue
+        taken = 0
+        value = 0.0
+        for use, (mask, amount) in zip(chosen, own):
+            if use:
+                if taken & mask:
+                    break
+                taken |= mask
+                value += amount
+        else:
+            if taken == target:
+                best = value if best is None else max(best, value)
+    return best
+
+
+def _auction(bids, num_items, bid_language, exact_item_limit=14):
+    auction = CombinatorialAuction(num_items, bid_language, exact_item_limit)
+    for bidder_id, items, amount in bids:
+        auction.add_bid(bidder_id, items, amount)
+    return auction
+
+
+@pytest.mark.parametrize("bid_language", ["XOR", "OR"])
+def test_exact_solver_matches_brute_force(bid_language):
+    rng = np.random.default_rng(0)
+    for _ in range(75):
+        num_items = int(rng.integers(1, 6))
+        bids = generate_package_bids(
+            int(rng.integers(1, 5)), num_items, bundles_per_bidder=3,
+            max_bundle_size=3, rng=rng
+        )
+        auction = _auction(bids, num_items, bid_language)
+        result = auction.run_auction()
+        atomic = auction.bids
+
+        assert result.exact
+        assert result.welfare == pytest.approx(_brute_force_welfare(atomic, bid_language))
+
+        items = [i for allocated in result.allocation.values() for i in allocated]
+        assert len(items) == len(set(items))
+
+        for bidder_id, payment in result.payments.items():
+            own_value = _bundle_value(
+                atomic, bidder_id, result.allocation[bidder_id], bid_language
+            )
+            without = _brute_force_welfare(atomic, bid_language, excluded=bidder_id)
+            expected = max(without - (result.welfare - own_value), 0.0)
+            assert payment == pytest.approx(expected)
+            assert payment <= own_value + 1e-9
+
+
+def test_vcg_payments_on_known_instance():
+    bids = [(0, [0], 10.0), (1, [1], 8.0), (2, [0, 1], 15.0)]
+    result = _auction(bids, 2, "XOR").run_auction()
+
+    assert result.allocation == {0: [0], 1: [1]}
+    assert result.payments == {0: pytest.approx(7.0), 1: pytest.approx(5.0)}
+    assert result.revenue == pytest.approx(12.0)
+
+
+def test_greedy_fallback_is_feasible():
+    rng = np.random.default_rng(1)
+    bids = generate_package_bids(6, 8, bundles_per_bidder=3, max_bundle_size=3, rng=rng)
+    result = _auction(bids, 8, "XOR", exact_item_limit=4).run_auction()
+
+    assert not result.exact
+    items = [i for allocated in result.allocation.values() for i in allocated]
+    assert len(items) == len(set(items))
+    assert all(p >= 0 for p in result.payments.values())
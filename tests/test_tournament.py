@@ -0,0 +1,53 @@
+import numpy as np
+
+from auction_simulator.tournament import StrategyTournament, enumerate_count_profiles
+
+
+def test_count_profiles_cover_all_compositions():
+    profiles = enumerate_count_profiles(3, 4)
+    assert len(profiles) == 15
+    assert np.all(profiles.sum(axis=1) == 4)
+    assert len({tuple(p) for p in profiles}) == 15
+
+
+def test_replicator_step_is_proportional_to_fitness():
+    tournament = StrategyTournament(
+        "second_price", 5, rounds_per_profile=500,
+        strategies=["truthful", "conservative", "random"], seed=1
+    )
+    shares = np.full(3, 1 / 3)
+    fitness = tournament.fitness(shares) + 1.0
+    expected = shares * fitness / np.dot(shares, fitness)
+
+    result = tournament.replicator_dynamics(iterations=1, background_fitness=1.0)
+
+    np.testing.assert_allclose(result["share_history"][1], expected)
+    # The weakest strategy shrinks gradually instead of vanishing in one step.
+    assert result["final_shares"]["random"] > 0.1
+
+
+def test_profiles_share_common_valuations():
+    # Conservative bidders bid truthfully in second-price auctions, so with
+    # common random numbers the two homogeneous profiles are identical.
+    tournament = StrategyTournament(
+        "second_price", 3, rounds_per_profile=200,
+        strategies=["truthful", "conservative"], seed=3
+    )
+    all_truthful = tournament.profile_payoffs([3, 0])
+    all_conservative = tournament.profile_payoffs([0, 3])
+    assert all_truthful[0] == all_conservative[1]
+
+
+def test_profile_payoffs_do_not_depend_on_evaluation_order():
+    def tournament():
+        return StrategyTournament(
+            "first_price", 3, rounds_per_profile=200,
+            strategies=["truthful", "random"], seed=5
+        )
+
+    forward = tournament().payoff_table()
+    backward = tournament()
+    for counts in reversed(enumerate_count_profiles(2, 3)):
+        backward.profile_payoffs(counts)
+    for key, payoffs in forward.items():
+        np.testing.assert_array_equal(backward.profile_payoffs(key), payoffs)
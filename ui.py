@@ -3,7 +3,7 @@ UI for Auction Strategy Game Simulator
 """
 import streamlit as st
 import numpy as np
-from game_logic import run_auction_simulation, create_results_dataframe, calculate_strategy_stats
+from game_logic import run_auction_simulation, create_results_dataframe, create_strategy_stats_table
 from auction_simulator import get_available_strategies
 from visualizations import (
     plot_bid_distribution, plot_revenue_comparison, plot_strategy_performance,
@@ -63,6 +63,13 @@ def main():
             val_mean = st.number_input("Mean Valuation", value=50.0, min_value=0.0)
             val_std = st.number_input("Standard Deviation", value=15.0, min_value=1.0)
             valuation_params = {"mean": val_mean, "std": val_std}
+        seed = int(st.number_input(
+            "Random Seed",
+            min_value=0,
+            value=42,
+            step=1,
+            help="Runs with the same seed and settings produce identical results"
+        ))
         st.subheader("Bidding Strategies")
         available_strategies = list(get_available_strategies().keys())
         strategy_config = st.selectbox(
@@ -82,7 +89,8 @@ def main():
             )
             strategies = [default_strategy] * num_bidders
         elif strategy_config == "mixed":
-            strategies = np.random.choice(available_strategies, num_bidders).tolist()
+            rng = np.random.default_rng(seed)
+            strategies = rng.choice(available_strategies, num_bidders).tolist()
             st.write("Randomly assigned strategies: " + ", ".join(strategies))
         else:
             strategies = []
@@ -99,7 +107,7 @@ def main():
     if run_simulation:
         results = run_auction_simulation(
             auction_type, num_bidders, num_simulations,
-            valuation_dist, valuation_params, strategies
+            valuation_dist, valuation_params, strategies, seed=seed
         )
         st.success(f"Completed {num_simulations} simulations!")
         st.subheader("Summary Metrics")
@@ -121,9 +129,9 @@ def main():
                 st.metric("Max Revenue", f"${max(revenues):.2f}")
         with tab2:
             df_results = create_results_dataframe(results['results'])
-            st.plotly_chart(plot_strategy_performance(df_results), use_container_width=True)
+            st.plotly_chart(plot_strategy_performance(df_results, results['strategy_stats']), use_container_width=True)
             st.subheader("Strategy Performance Table")
-            strategy_stats = calculate_strategy_stats(df_results)
+            strategy_stats = create_strategy_stats_table(results['strategy_stats'])
             st.dataframe(strategy_stats, use_container_width=True)
         with tab3:
             st.plotly_chart(plot_bid_vs_valuation(results['results'], auction_type), use_container_width=True)
@@ -10,6 +10,17 @@ import numpy as np
 import pandas as pd
 from typing import List, Dict, Any
 import streamlit as st
+from auction_simulator.bootstrap import bootstrap_mean_ci, bootstrap_group_means
+
+
+def _error_bars(values: List[float], lower: List[float], upper: List[float]) -> Dict[str, Any]:
+    values = np.asarray(values, dtype=float)
+    return dict(
+        type='data',
+        symmetric=False,
+        array=np.maximum(np.asarray(upper) - values, 0),
+        arrayminus=np.maximum(values - np.asarray(lower), 0)
+    )
 
 
 def plot_bid_distribution(results: List[Any], auction_type: str) -> go.Figure:
@@ -63,31 +74,43 @@ def plot_revenue_comparison(simulation_results: Dict[str, Any]) -> go.Figure:
     return fig
 
 
-def plot_strategy_performance(df: pd.DataFrame) -> go.Figure:
-    strategy_stats = df.groupby('winner_strategy').agg({
-        'winner_payoff': ['mean', 'count'],
-        'payment': 'mean'
-    }).round(2)
+def plot_strategy_performance(df: pd.DataFrame,
+                              strategy_stats: Dict[str, Dict[str, float]]) -> go.Figure:
+    # Win counts come from the winners' table; expected payoffs come from the
+    # per-strategy accumulator, so zero-payoff losses are included.
+    strategies = list(strategy_stats.keys())
+    win_counts = [strategy_stats[s]['total_wins'] for s in strategies]
+    expected_payoffs = [strategy_stats[s]['expected_payoff'] for s in strategies]
     
-    strategies = strategy_stats.index.tolist()
-    win_counts = strategy_stats[('winner_payoff', 'count')].tolist()
-    avg_payoffs = strategy_stats[('winner_payoff', 'mean')].tolist()
+    intervals = bootstrap_group_means(df['winner_payoff'], df['winner_strategy'], rng=0)
+    win_errors = _error_bars(
+        win_counts,
+        [intervals[s]['count_lower'] if s in intervals else 0 for s in strategies],
+        [intervals[s]['count_upper'] if s in intervals else 0 for s in strategies]
+    )
+    margins = [1.96 * strategy_stats[s]['payoff_std_error'] for s in strategies]
+    payoff_errors = _error_bars(
+        expected_payoffs,
+        [p - m for p, m in zip(expected_payoffs, margins)],
+        [p + m for p, m in zip(expected_payoffs, margins)]
+    )
     
     fig = make_subplots(
         rows=1, cols=2,
-        subplot_titles=('Win Count by Strategy', 'Average Payoff by Strategy'),
+        subplot_titles=('Win Count by Strategy', 'Expected Payoff by Strategy'),
         specs=[[{"secondary_y": False}, {"secondary_y": False}]]
     )
     
     # Win counts
     fig.add_trace(
-        go.Bar(x=strategies, y=win_counts, name="Wins"),
+        go.Bar(x=strategies, y=win_counts, name="Wins", error_y=win_errors),
         row=1, col=1
     )
     
-    # Average payoffs
+    # Expected payoffs per participation
     fig.add_trace(
-        go.Bar(x=strategies, y=avg_payoffs, name="Avg Payoff", marker_color='orange'),
+        go.Bar(x=strategies, y=expected_payoffs, name="Expected Payoff", marker_color='orange',
+               error_y=payoff_errors),
         row=1, col=2
     )
     
@@ -201,18 +224,26 @@ def plot_auction_comparison(results_dict: Dict[str, Dict[str, Any]]) -> go.Figur
     avg_revenues = [results_dict[at]['average_revenue'] for at in auction_types]
     avg_efficiencies = [results_dict[at]['average_efficiency'] for at in auction_types]
     
+    revenue_cis = [bootstrap_mean_ci(results_dict[at]['all_revenues'], rng=0) for at in auction_types]
+    efficiency_cis = [bootstrap_mean_ci(results_dict[at]['all_efficiencies'], rng=0) for at in auction_types]
+    revenue_errors = _error_bars(avg_revenues, [ci['lower'] for ci in revenue_cis],
+                                 [ci['upper'] for ci in revenue_cis])
+    efficiency_errors = _error_bars(avg_efficiencies, [ci['lower'] for ci in efficiency_cis],
+                                    [ci['upper'] for ci in efficiency_cis])
+    
     fig = make_subplots(
         rows=1, cols=2,
         subplot_titles=('Average Revenue Comparison', 'Average Efficiency Comparison')
     )
     
     fig.add_trace(
-        go.Bar(x=auction_types, y=avg_revenues, name="Revenue"),
+        go.Bar(x=auction_types, y=avg_revenues, name="Revenue", error_y=revenue_errors),
         row=1, col=1
     )
     
     fig.add_trace(
-        go.Bar(x=auction_types, y=avg_efficiencies, name="Efficiency", marker_color='green'),
+        go.Bar(x=auction_types, y=avg_efficiencies, name="Efficiency", marker_color='green',
+               error_y=efficiency_errors),
         row=1, col=2
     )
     